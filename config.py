@@ -15,10 +15,14 @@ class ScraperConfig:
 
     output_dir: str = "fed_press_conferences"
 
+    cache_dir: str = "pdf_cache"
+
     request_timeout: int = 30
 
     delay: float = 1.0
 
+    concurrency: int = 8
+
     max_retries: int = 3
     retry_delay: float = 2.0
 
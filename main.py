@@ -7,20 +7,70 @@ and extracts the raw text, saving it as .txt files.
 The PDFs follow the format: FOMCpresconf<date>.pdf where date is YYYYMMDD
 """
 
+import hashlib
 import logging
-import re
+import multiprocessing
+import os
+import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import requests
-import pdfplumber
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import ahocorasick
+import re2
 from io import BytesIO
 from tqdm import tqdm
 
 
 from config import ScraperConfig
 
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+PDFIUM_LOCK = threading.Lock()
+# Same characters as Python re's \s and \d on str patterns
+RE2_WHITESPACE = r"[\t\n\v\f\r\x{1c}-\x{1f}\x{85}\p{Z}]"
+RE2_DIGIT = r"\p{Nd}"
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if char is a regex word character (alphanumeric or underscore)"""
+    return char.isalnum() or char == "_"
+
+
+def _is_word_boundary(text: str, index: int) -> bool:
+    """
+    Check whether a regex-style word boundary sits at the given index
+
+    Args:
+        text: Text being searched
+        index: Position between text[index - 1] and text[index]
+
+    Returns:
+        True if exactly one side of the position is a word character
+    """
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _configure_logging() -> None:
+    """
+    Configure logging for the scraper
+
+    Also used as the initializer of PDF parse workers, which are spawned and so
+    would otherwise log through Python's unformatted last-resort handler.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[logging.FileHandler("scraper.log"), logging.StreamHandler()],
+    )
+
 
 class ScraperError(Exception):
     """Custom exception for scraper-related errors"""
@@ -28,6 +78,294 @@ class ScraperError(Exception):
     pass
 
 
+class RateLimiter:
+    """Thread-safe limiter that spaces out requests by a minimum interval"""
+
+    def __init__(self, interval: float):
+        """
+        Initialize the rate limiter
+
+        Args:
+            interval: Minimum number of seconds between two requests
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller is allowed to issue the next request"""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class RateLimitedRetry(Retry):
+    """urllib3 retry policy that also waits on a rate limiter before each retry"""
+
+    def __init__(self, *args, rate_limiter: Optional[RateLimiter] = None, **kwargs):
+        """
+        Initialize the retry policy
+
+        Args:
+            rate_limiter: Limiter to wait on after the backoff sleep, if any
+        """
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def new(self, **kwargs) -> "RateLimitedRetry":
+        """Copy the policy for the next attempt, keeping the rate limiter"""
+        retry = super().new(**kwargs)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+
+    def sleep(self, response=None) -> None:
+        """Sleep for the backoff period, then for the next rate-limited slot"""
+        super().sleep(response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+
+
+class TextCleaner:
+    """Removes transcript boilerplate and tags names in extracted text"""
+
+    def __init__(self, names: List[str]):
+        """
+        Initialize the text cleaner
+
+        Args:
+            names: Names to tag
+        """
+        self.names = names
+        self._compile_regex_patterns()
+        self.name_automaton = self._build_name_automaton(names)
+
+    def _compile_regex_patterns(self) -> None:
+        """Compile regex patterns for efficiency"""
+        # Dates such as "June 14, 2023", also accepting years split apart during
+        # extraction ("202 3")
+        date = r"[A-Za-z]+\s+\d{1,2}\s*,\s*(?:\d{4}|\d{3}\s+\d)"
+        press_conference = r"Chair\s+Powell(?:['\x{2019}]|\s)*s\s+Press\s+Conference"
+        cleanup_patterns = [
+            # Page numbers
+            r"Page \d+ of \d+",
+            # Running page header
+            date + r"\s+" + press_conference + r"\s+FINAL",
+            # Transcript title with date, listed before the undated title so it wins
+            r"Transcript\s+of\s+" + press_conference + r"\s+" + date,
+            # Transcript title
+            r"Transcript\s+of\s+" + press_conference,
+        ]
+        cleanup_source = "|".join(f"(?:{p})" for p in cleanup_patterns)
+        # RE2's \s and \d are ASCII-only, so spell out the Unicode classes Python's
+        # re uses, otherwise boilerplate containing e.g. a non-breaking space survives
+        cleanup_source = cleanup_source.replace(r"\s", RE2_WHITESPACE).replace(r"\d", RE2_DIGIT)
+        # RE2 matches in linear time, so malformed PDF text cannot trigger
+        # catastrophic backtracking in the nested whitespace patterns
+        self.cleanup_pattern = re2.compile(cleanup_source)
+        # Every cleanup pattern contains one of these literals, so text without
+        # any of them cannot match and the regex scan can be skipped
+        self.cleanup_markers = ("Page ", "Transcript", "Chair")
+
+    def _build_name_automaton(self, names: List[str]) -> Optional[ahocorasick.Automaton]:
+        """
+        Build an Aho-Corasick automaton matching all names in a single pass
+
+        Args:
+            names: Names to match
+
+        Returns:
+            Automaton mapping each name to itself, or None if there are no names
+        """
+        if not names:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        return automaton
+
+    def clean(self, text_content: str) -> str:
+        """
+        Clean extracted text by removing redundant data and formatting
+
+        Args:
+            text_content: Raw extracted text from PDF
+
+        Returns:
+            Cleaned text content
+        """
+        if not text_content:
+            return text_content
+
+        if any(marker in text_content for marker in self.cleanup_markers):
+            text_content = self.cleanup_pattern.sub("", text_content)
+        # Collapses every whitespace run to one space and strips both ends
+        return " ".join(text_content.split())
+
+    def tag_names(self, text_content: str) -> str:
+        """
+        Tag names in text with <NAME> tags
+
+        Existing tags are removed first, so re-tagging after the names list
+        changes drops tags for names that are no longer listed.
+
+        Args:
+            text_content: Text content to process
+
+        Returns:
+            Text with names tagged
+        """
+        text_content = text_content.replace("<NAME>", "").replace("</NAME>", "")
+        if self.name_automaton is None:
+            return text_content
+
+        matches = []
+        for end, name in self.name_automaton.iter(text_content):
+            start = end - len(name) + 1
+            if _is_word_boundary(text_content, start) and _is_word_boundary(text_content, end + 1):
+                matches.append((start, end + 1, name))
+
+        # Prefer the leftmost, then longest, match and drop any that overlap it
+        matches.sort(key=lambda match: (match[0], match[0] - match[1]))
+
+        tagged_parts = []
+        position = 0
+        for start, end, name in matches:
+            if start < position:
+                continue
+            tagged_parts.append(text_content[position:start])
+            tagged_parts.append(f"<NAME>{name}</NAME>")
+            position = end
+        tagged_parts.append(text_content[position:])
+
+        return "".join(tagged_parts)
+
+
+_worker_text_cleaner: Optional[TextCleaner] = None
+
+
+def _init_text_worker(names: List[str]) -> None:
+    """
+    Build the text cleaner once per worker process
+
+    Args:
+        names: Names to tag
+    """
+    global _worker_text_cleaner
+    _worker_text_cleaner = TextCleaner(names)
+
+
+def _rewrite_text_file(text_file: Path, transform: Callable[[str], str]) -> Optional[str]:
+    """
+    Apply a transformation to a text file in place
+
+    The file is only rewritten if the transformation changed its content.
+
+    Args:
+        text_file: Path of the text file to rewrite
+        transform: Function mapping the current content to the new content
+
+    Returns:
+        None if successful, otherwise a description of the error
+    """
+    try:
+        old_content = text_file.read_bytes().decode("utf-8")
+        new_content = transform(old_content)
+        if new_content != old_content:
+            text_file.write_bytes(new_content.encode("utf-8"))
+
+        return None
+
+    except Exception as e:
+        return str(e)
+
+
+def _clean_text_file(text_file: Path) -> Optional[str]:
+    """
+    Clean a text file in place using the worker's text cleaner
+
+    Args:
+        text_file: Path of the text file to clean
+
+    Returns:
+        None if successful, otherwise a description of the error
+    """
+    return _rewrite_text_file(text_file, _worker_text_cleaner.clean)
+
+
+def _tag_text_file(text_file: Path) -> Optional[str]:
+    """
+    Tag names in a text file in place using the worker's text cleaner
+
+    Args:
+        text_file: Path of the text file to tag
+
+    Returns:
+        None if successful, otherwise a description of the error
+    """
+    return _rewrite_text_file(text_file, _worker_text_cleaner.tag_names)
+
+
+def extract_text_from_pdf_source(pdf_source: Union[str, BinaryIO]) -> str:
+    """
+    Extract text from a PDF
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        pdf_source: Path to the PDF or file-like object containing it
+
+    Returns:
+        Extracted text
+
+    Raises:
+        ScraperError: If there's an error extracting text
+    """
+    # Imported lazily so runs that only re-clean existing text files skip loading PDFium
+    import pypdfium2 as pdfium
+
+    logger = logging.getLogger(__name__)
+
+    try:
+        text_parts = []
+
+        # PDFium is not thread-safe, so documents are parsed one at a time per process
+        with PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(pdf_source)
+            try:
+                for page_num, page in enumerate(pdf, 1):
+                    try:
+                        textpage = page.get_textpage()
+                        page_text = textpage.get_text_range()
+                        textpage.close()
+                        # Whitespace-only pages count as empty, so a PDF without real
+                        # text raises below and is evicted from the cache
+                        if page_text.strip():
+                            text_parts.append(page_text)
+                        else:
+                            logger.warning(f"No text extracted from page {page_num}")
+                    except Exception as e:
+                        logger.warning(f"Error extracting text from page {page_num}: {e}")
+                        continue
+                    finally:
+                        page.close()
+            finally:
+                pdf.close()
+
+        if not text_parts:
+            raise ScraperError("No text could be extracted from any page")
+
+        return "\n".join(text_parts).strip()
+
+    except Exception as e:
+        raise ScraperError(f"Error extracting text from PDF: {e}") from e
+
+
 class FEDPressConferenceScraper:
     """Scraper for FED Press Conference PDFs"""
 
@@ -37,10 +375,24 @@ class FEDPressConferenceScraper:
 
         Args:
             config: Configuration object for the scraper
+
+        Raises:
+            ScraperError: If constructed while a worker process is importing the main module
         """
+        # PDF parse workers are spawned and re-import the script that started them.
+        # Refuse to run there, otherwise an unguarded script would re-run the scrape
+        # in every worker (same check multiprocessing uses for its own bootstrapping).
+        if getattr(multiprocessing.current_process(), "_inheriting", False):
+            raise ScraperError(
+                "FEDPressConferenceScraper was created while a worker process was importing "
+                "the main module; guard the calling script with if __name__ == '__main__'"
+            )
+
         self.config = config or ScraperConfig()
         self.output_dir = Path(self.config.output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = Path(self.config.cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
 
         self._setup_logging()
 
@@ -50,34 +402,31 @@ class FEDPressConferenceScraper:
                 "User-Agent": "FED-Press-Conference-Scraper/1.0 (+https://github.com/<yourusername>/fed-scraper)"
             }
         )
+        self.rate_limiter = RateLimiter(self.config.delay)
+        retry = RateLimitedRetry(
+            total=self.config.max_retries,
+            backoff_factor=self.config.retry_delay,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+            rate_limiter=self.rate_limiter,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=self.config.concurrency,
+            pool_maxsize=self.config.concurrency,
+        )
+        self.session.mount("https://", adapter)
+        self._thread_local = threading.local()
 
-        self._compile_regex_patterns()
+        self.names = self._load_names_from_file()
+        self.text_cleaner = TextCleaner(self.names)
 
     def _setup_logging(self) -> None:
         """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            handlers=[logging.FileHandler("scraper.log"), logging.StreamHandler()],
-        )
+        _configure_logging()
         self.logger = logging.getLogger(__name__)
 
-    def _compile_regex_patterns(self) -> None:
-        """Compile regex patterns for efficiency"""
-        self.page_number_pattern = re.compile(r"Page \d+ of \d+")
-        self.header_pattern = re.compile(
-            r"[A-Za-z]+\s+\d{1,2}\s*,\s*\d{3}\s*\d\s+Chair\s+Powell\s*['\u2019\s]*s\s+Press\s+Conference\s+FINAL"
-        )
-        self.transcript_with_date_pattern = re.compile(
-            r"Transcript\s+of\s+Chair\s+Powell\s*['\u2019\s]*s\s+Press\s+Conference\s+[A-Za-z]+\s+\d{1,2}\s*,\s*\d{3}\s*\d"
-        )
-        self.transcript_pattern = re.compile(
-            r"Transcript\s+of\s+Chair\s+Powell\s*['\u2019\s]*s\s+Press\s+Conference"
-        )
-        self.whitespace_pattern = re.compile(r"\s+")
-
-        self.names = self._load_names_from_file()
-
     def _load_names_from_file(self, filename: str = "names.txt") -> List[str]:
         """
         Load names from a text file for tagging
@@ -94,8 +443,8 @@ class FEDPressConferenceScraper:
                 self.logger.warning(f"Names file {filename} not found, no names will be tagged")
                 return []
 
-            with open(filepath, "r", encoding="utf-8") as f:
-                names = [line.strip() for line in f if line.strip()]
+            lines = filepath.read_text(encoding="utf-8").splitlines()
+            names = [line.strip() for line in lines if line.strip()]
 
             self.logger.info(f"Loaded {len(names)} names for tagging from {filename}")
             return names
@@ -122,53 +471,84 @@ class FEDPressConferenceScraper:
             if not filepath.exists():
                 raise FileNotFoundError(f"Date file {filename} not found")
 
-            with open(filepath, "r", encoding="utf-8") as f:
-                return [line.strip() for line in f if line.strip()]
+            lines = filepath.read_text(encoding="utf-8").splitlines()
+            return [line.strip() for line in lines if line.strip()]
 
         except Exception as e:
             raise ScraperError(f"Error reading date file: {e}") from e
 
-    def download_pdf(self, date_str: str) -> Optional[bytes]:
+    def _get_download_buffer(self) -> BytesIO:
         """
-        Download a PDF for a specific date with retry logic
+        Get the calling thread's reusable download buffer
+
+        Returns:
+            Buffer rewound to the start, ready to be overwritten
+        """
+        buffer = getattr(self._thread_local, "download_buffer", None)
+        if buffer is None:
+            buffer = BytesIO()
+            self._thread_local.download_buffer = buffer
+
+        buffer.seek(0)
+        return buffer
+
+    def _release_download_buffer(self) -> None:
+        """
+        Drop the calling thread's download buffer
+
+        A reused buffer keeps the capacity of the largest PDF its thread has seen, so
+        with ``concurrency`` threads that memory stays allocated for the whole run.
+        Releasing it once the PDF has been written to the cache frees that memory;
+        the next download on the thread allocates a fresh buffer.
+        """
+        self._thread_local.download_buffer = None
+
+    def download_pdf(self, date_str: str) -> Optional[BytesIO]:
+        """
+        Download a PDF for a specific date
+
+        Every request, including retries of connection errors and 5xx responses by the
+        session adapter, waits for a rate limiter slot.
+
+        A single streamed GET is issued per date, so each PDF costs one rate limiter
+        slot; a missing PDF is detected from the 404 before any body is read. The PDF
+        is streamed in chunks into a buffer that is reused by the next download on the
+        same thread.
 
         Args:
             date_str: Date in YYYYMMDD format
 
         Returns:
-            PDF content if successful, None otherwise
+            File-like object positioned at the start of the PDF if successful, None otherwise
         """
         filename = f"FOMCpresconf{date_str}.pdf"
         url = f"{self.config.base_url}{filename}"
 
-        for attempt in range(self.config.max_retries):
-            try:
-                self.logger.info(f"Attempting to download: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=self.config.request_timeout)
-
+        try:
+            self.logger.info(f"Attempting to download: {url}")
+            self.rate_limiter.wait()
+            with self.session.get(
+                url, stream=True, timeout=self.config.request_timeout
+            ) as response:
                 if response.status_code == 200:
+                    pdf_file = self._get_download_buffer()
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        pdf_file.write(chunk)
+                    pdf_file.truncate()
+                    pdf_file.seek(0)
+
                     self.logger.info(f"Successfully downloaded: {filename}")
-                    return response.content
+                    return pdf_file
                 elif response.status_code == 404:
                     self.logger.warning(f"PDF not found for date {date_str}: {filename}")
                     return None
                 else:
-                    self.logger.warning(
-                        f"Failed to download {filename}: HTTP {response.status_code}"
-                    )
-
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Error downloading {filename} (attempt {attempt + 1}): {e}")
-                if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay)
-                    continue
-                else:
-                    self.logger.error(
-                        f"Failed to download {filename} after {self.config.max_retries} attempts"
-                    )
+                    self.logger.error(f"Failed to download {filename}: HTTP {response.status_code}")
                     return None
 
-        return None
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Failed to download {filename}: {e}")
+            return None
 
     def clean_extracted_text(self, text_content: str) -> str:
         """
@@ -180,20 +560,9 @@ class FEDPressConferenceScraper:
         Returns:
             Cleaned text content
         """
-        if not text_content:
-            return text_content
-
-        text_content = self.page_number_pattern.sub("", text_content)
-        text_content = self.header_pattern.sub("", text_content)
-        text_content = self.transcript_with_date_pattern.sub("", text_content)
-        text_content = self.transcript_pattern.sub("", text_content)
-        text_content = self.whitespace_pattern.sub(" ", text_content)
-
-        text_content = self._tag_names_in_text(text_content)
-
-        return text_content.strip()
+        return self.text_cleaner.clean(text_content)
 
-    def _tag_names_in_text(self, text_content: str) -> str:
+    def tag_names_in_text(self, text_content: str) -> str:
         """
         Tag names in text with <NAME> tags
 
@@ -203,24 +572,14 @@ class FEDPressConferenceScraper:
         Returns:
             Text with names tagged
         """
-        if not self.names:
-            return text_content
-
-        tagged_text = text_content
-
-        for name in self.names:
-            if name in tagged_text:
-                pattern = r"\b" + re.escape(name) + r"\b"
-                tagged_text = re.sub(pattern, f"<NAME>{name}</NAME>", tagged_text)
-
-        return tagged_text
+        return self.text_cleaner.tag_names(text_content)
 
-    def extract_text_from_pdf(self, pdf_content: bytes) -> str:
+    def extract_text_from_pdf(self, pdf_file: BinaryIO) -> str:
         """
         Extract text from PDF content
 
         Args:
-            pdf_content: PDF file content
+            pdf_file: File-like object containing the PDF
 
         Returns:
             Extracted text
@@ -228,29 +587,144 @@ class FEDPressConferenceScraper:
         Raises:
             ScraperError: If there's an error extracting text
         """
+        return extract_text_from_pdf_source(pdf_file)
+
+    def _write_cache_file(self, filepath: Path, data: bytes) -> None:
+        """
+        Write a cache file atomically so an interrupted run never leaves a partial entry
+
+        Args:
+            filepath: Destination path inside the cache directory
+            data: Content to write
+        """
+        # A unique temp name, since concurrent downloads may write the same digest
+        temp_file = tempfile.NamedTemporaryFile(
+            dir=filepath.parent, prefix=f"{filepath.name}.", suffix=".tmp", delete=False
+        )
+        temp_path = Path(temp_file.name)
         try:
-            pdf_file = BytesIO(pdf_content)
-            text_parts = []
+            with temp_file:
+                temp_file.write(data)
+            temp_path.replace(filepath)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _read_cached_digest(self, date_str: str) -> Optional[str]:
+        """
+        Look up the content digest of the PDF previously downloaded for a date
 
-            with pdfplumber.open(pdf_file) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(page_text)
-                        else:
-                            self.logger.warning(f"No text extracted from page {page_num}")
-                    except Exception as e:
-                        self.logger.warning(f"Error extracting text from page {page_num}: {e}")
-                        continue
+        Args:
+            date_str: Date in YYYYMMDD format
 
-            if not text_parts:
-                raise ScraperError("No text could be extracted from any page")
+        Returns:
+            SHA-256 hex digest if the date has been downloaded before, None otherwise
+        """
+        digest_file = self.cache_dir / f"FOMCpresconf{date_str}.sha256"
+        if not digest_file.exists():
+            return None
+        return digest_file.read_text(encoding="utf-8").strip()
 
-            return "\n".join(text_parts).strip()
+    def _cache_pdf(self, date_str: str, pdf_file: BytesIO) -> str:
+        """
+        Store a downloaded PDF in the cache under its content digest
 
-        except Exception as e:
-            raise ScraperError(f"Error extracting text from PDF: {e}") from e
+        Args:
+            date_str: Date in YYYYMMDD format
+            pdf_file: Buffer holding the downloaded PDF
+
+        Returns:
+            SHA-256 hex digest of the PDF
+        """
+        with pdf_file.getbuffer() as pdf_content:
+            digest = hashlib.sha256(pdf_content).hexdigest()
+            pdf_path = self.cache_dir / f"{digest}.pdf"
+            if not pdf_path.exists():
+                self._write_cache_file(pdf_path, pdf_content)
+
+        self._write_cache_file(
+            self.cache_dir / f"FOMCpresconf{date_str}.sha256", digest.encode("utf-8")
+        )
+        return digest
+
+    def _evict_cached_pdf(self, date_str: str, digest: str) -> None:
+        """
+        Remove a date's digest mapping and cached PDF
+
+        Args:
+            date_str: Date in YYYYMMDD format
+            digest: SHA-256 hex digest of the cached PDF
+        """
+        self.logger.warning(f"Discarding cached PDF for {date_str}, it will be downloaded again")
+        (self.cache_dir / f"FOMCpresconf{date_str}.sha256").unlink(missing_ok=True)
+        (self.cache_dir / f"{digest}.pdf").unlink(missing_ok=True)
+
+    def get_raw_text(
+        self, date_str: str, parse_pool: Optional[ProcessPoolExecutor] = None
+    ) -> Optional[str]:
+        """
+        Get the uncleaned text of a press conference, using the cache where possible
+
+        Cached raw text is returned directly; otherwise text is extracted from the
+        cached PDF, downloading it first if the date has never been fetched. Newly
+        extracted text is added to the cache; a PDF whose text cannot be extracted
+        is removed from it so the next run downloads it again.
+
+        Args:
+            date_str: Date in YYYYMMDD format
+            parse_pool: Process pool to run PDF text extraction in, or None to extract
+                in the calling thread
+
+        Returns:
+            Extracted text, or None if no PDF exists for the date
+
+        Raises:
+            ScraperError: If there's an error extracting text
+        """
+        digest = self._read_cached_digest(date_str)
+        if digest is not None:
+            raw_text_path = self.cache_dir / f"{digest}.raw.txt"
+            if raw_text_path.exists():
+                self.logger.info(f"Using cached text for {date_str}")
+                return raw_text_path.read_bytes().decode("utf-8")
+
+            pdf_path = self.cache_dir / f"{digest}.pdf"
+            if not pdf_path.exists():
+                digest = None
+
+        if digest is None:
+            pdf_file = self.download_pdf(date_str)
+            if pdf_file is None:
+                return None
+
+            digest = self._cache_pdf(date_str, pdf_file)
+            pdf_path = self.cache_dir / f"{digest}.pdf"
+            if parse_pool is not None:
+                # The worker parses the cached file, so the buffer is no longer needed
+                pdf_file = None
+                self._release_download_buffer()
+        else:
+            self.logger.info(f"Using cached PDF for {date_str}")
+            pdf_file = None
+
+        try:
+            if parse_pool is not None:
+                # The worker reads the cached PDF from disk, so no PDF bytes are pickled
+                text_content = parse_pool.submit(
+                    extract_text_from_pdf_source, str(pdf_path)
+                ).result()
+            elif pdf_file is not None:
+                text_content = self.extract_text_from_pdf(pdf_file)
+            else:
+                text_content = extract_text_from_pdf_source(str(pdf_path))
+        except ScraperError:
+            # Don't keep a PDF that can't be parsed (e.g. an HTML error page served
+            # with a 200), so the next run downloads it again
+            self._evict_cached_pdf(date_str, digest)
+            raise
+
+        self._write_cache_file(self.cache_dir / f"{digest}.raw.txt", text_content.encode("utf-8"))
+        return text_content
 
     def save_text_file(self, date_str: str, text_content: str) -> bool:
         """
@@ -271,9 +745,7 @@ class FEDPressConferenceScraper:
         filepath = self.output_dir / filename
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(text_content)
-
+            filepath.write_bytes(text_content.encode("utf-8"))
             self.logger.info(f"Saved text file: {filepath}")
             return True
 
@@ -281,54 +753,81 @@ class FEDPressConferenceScraper:
             self.logger.error(f"Error saving text file {filepath}: {e}")
             return False
 
-    def clean_all_text_files(self) -> int:
+    def _rewrite_all_text_files(
+        self, rewrite_file: Callable[[Path], Optional[str]], action: str, description: str
+    ) -> int:
         """
-        Clean all existing text files in the output directory
+        Rewrite all existing text files in the output directory across CPU cores
+
+        Args:
+            rewrite_file: Module-level function rewriting one file in a worker process
+            action: Verb naming the rewrite in log messages, e.g. "clean"
+            description: Present participle naming the rewrite, e.g. "Cleaning"
 
         Returns:
-            Number of successfully cleaned files
+            Number of successfully rewritten files
         """
-        self.logger.info("Starting to clean all text files...")
+        self.logger.info(f"Starting to {action} all text files...")
         text_files = list(self.output_dir.glob("FOMCpresconf*.txt"))
 
         if not text_files:
-            self.logger.info("No text files found to clean")
+            self.logger.info(f"No text files found to {action}")
             return 0
 
-        cleaned_count = 0
+        success_count = 0
         failed_files = []
 
-        for text_file in tqdm(text_files, desc="Cleaning text files"):
-            try:
-                with open(text_file, "r", encoding="utf-8") as f:
-                    raw_content = f.read()
+        with ProcessPoolExecutor(initializer=_init_text_worker, initargs=(self.names,)) as executor:
+            results = executor.map(rewrite_file, text_files, chunksize=8)
+            for text_file, error in tqdm(
+                zip(text_files, results),
+                total=len(text_files),
+                desc=f"{description} text files",
+                disable=None,
+            ):
+                if error is None:
+                    success_count += 1
+                else:
+                    self.logger.error(f"Error {description.lower()} {text_file}: {error}")
+                    failed_files.append(str(text_file))
+
+        if failed_files:
+            self.logger.warning(f"Failed to {action} {len(failed_files)} files: {failed_files}")
 
-                cleaned_content = self.clean_extracted_text(raw_content)
+        self.logger.info(
+            f"{description} completed. {success_count}/{len(text_files)} files processed successfully"
+        )
+        return success_count
 
-                with open(text_file, "w", encoding="utf-8") as f:
-                    f.write(cleaned_content)
+    def clean_all_text_files(self) -> int:
+        """
+        Clean all existing text files in the output directory
 
-                cleaned_count += 1
+        Returns:
+            Number of successfully cleaned files
+        """
+        return self._rewrite_all_text_files(_clean_text_file, "clean", "Cleaning")
 
-            except Exception as e:
-                self.logger.error(f"Error cleaning {text_file}: {e}")
-                failed_files.append(str(text_file))
-                continue
+    def tag_all_text_files(self) -> int:
+        """
+        Tag names in all existing text files in the output directory
 
-        if failed_files:
-            self.logger.warning(f"Failed to clean {len(failed_files)} files: {failed_files}")
+        Run after clean_all_text_files. Re-running it after names.txt changes
+        regenerates the tags without repeating the boilerplate cleanup.
 
-        self.logger.info(
-            f"Cleaning completed. {cleaned_count}/{len(text_files)} files cleaned successfully"
-        )
-        return cleaned_count
+        Returns:
+            Number of successfully tagged files
+        """
+        return self._rewrite_all_text_files(_tag_text_file, "tag", "Tagging")
 
-    def process_date(self, date_str: str) -> bool:
+    def process_date(self, date_str: str, parse_pool: Optional[ProcessPoolExecutor] = None) -> bool:
         """
-        Process a single date: download PDF, extract text, and save
+        Process a single date: download or load cached PDF, extract text, and save
 
         Args:
             date_str: Date in YYYYMMDD format
+            parse_pool: Process pool to run PDF text extraction in, or None to extract
+                in the calling thread
 
         Returns:
             True if successful, False otherwise
@@ -339,11 +838,10 @@ class FEDPressConferenceScraper:
             return True
 
         try:
-            pdf_content = self.download_pdf(date_str)
-            if pdf_content is None:
+            text_content = self.get_raw_text(date_str, parse_pool)
+            if text_content is None:
                 return False
 
-            text_content = self.extract_text_from_pdf(pdf_content)
             if not text_content:
                 self.logger.warning(f"No text extracted from PDF for {date_str}")
                 return False
@@ -354,10 +852,43 @@ class FEDPressConferenceScraper:
             self.logger.error(f"Error processing date {date_str}: {e}")
             return False
 
+    def _start_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        Create the process pool used for PDF text extraction and start a worker
+
+        Workers are spawned rather than forked because download threads run while
+        they start. Spawned workers re-import the calling script, so a worker is
+        started up front: if the script cannot be imported safely, scraping fails
+        here before any request is sent.
+
+        Returns:
+            Process pool with at least one running worker
+
+        Raises:
+            ScraperError: If the worker processes cannot start
+        """
+        parse_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"), initializer=_configure_logging
+        )
+        try:
+            parse_pool.submit(os.getpid).result()
+        except BrokenProcessPool as e:
+            parse_pool.shutdown()
+            raise ScraperError(
+                "PDF parse workers failed to start; guard the calling script with "
+                "if __name__ == '__main__'"
+            ) from e
+
+        return parse_pool
+
     def scrape_predefined_dates(self) -> Tuple[int, int]:
         """
         Scrape press conferences using predefined dates from file
 
+        PDFs are parsed in spawned worker processes, which re-import the calling
+        script, so the script must guard its entry point with
+        if __name__ == "__main__".
+
         Returns:
             Tuple of (success_count, total_count)
         """
@@ -372,11 +903,26 @@ class FEDPressConferenceScraper:
             success_count = 0
             total_count = len(dates)
 
-            for date_str in tqdm(dates, desc="Scraping press conferences"):
-                if self.process_date(date_str):
-                    success_count += 1
-
-                time.sleep(self.config.delay)
+            # Downloads overlap in threads while PDF parsing, which is CPU-bound and
+            # serialised by PDFium within a process, is spread across CPU cores
+            parse_pool = self._start_parse_pool()
+            with parse_pool, ThreadPoolExecutor(max_workers=self.config.concurrency) as executor:
+                futures = [
+                    executor.submit(self.process_date, date_str, parse_pool) for date_str in dates
+                ]
+                try:
+                    for future in tqdm(
+                        as_completed(futures),
+                        total=total_count,
+                        desc="Scraping press conferences",
+                        disable=None,
+                    ):
+                        if future.result():
+                            success_count += 1
+                except KeyboardInterrupt:
+                    for future in futures:
+                        future.cancel()
+                    raise
 
             self.logger.info(
                 f"Scraping completed. Total: {total_count}, Successful: {success_count}"
@@ -406,6 +952,10 @@ def main() -> None:
         cleaned_count = scraper.clean_all_text_files()
         scraper.logger.info(f"Text cleaning completed! {cleaned_count} files cleaned successfully.")
 
+        scraper.logger.info("Starting name tagging process...")
+        tagged_count = scraper.tag_all_text_files()
+        scraper.logger.info(f"Name tagging completed! {tagged_count} files tagged successfully.")
+
     except KeyboardInterrupt:
         scraper.logger.info("Scraping interrupted by user")
     except Exception as e: